@@ -18,11 +18,20 @@ Usage:
 import re
 import sys
 import json
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    orjson = None
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class BenchmarkResult:
     """Parsed benchmark result from Go test output."""
     name: str
@@ -30,11 +39,11 @@ class BenchmarkResult:
     ns_per_op: float
     bytes_per_op: Optional[int] = None
     allocs_per_op: Optional[int] = None
+    ms_per_op: float = field(init=False)
 
-    @property
-    def ms_per_op(self) -> float:
-        """Convert nanoseconds to milliseconds."""
-        return self.ns_per_op / 1_000_000
+    def __post_init__(self) -> None:
+        # Convert nanoseconds to milliseconds once; gates read it repeatedly
+        self.ms_per_op = self.ns_per_op / 1_000_000
 
     @property
     def us_per_op(self) -> float:
@@ -85,53 +94,68 @@ PERFORMANCE_GATES: Dict[str, Dict[str, Any]] = {
     },
 }
 
-# Pattern to match Go benchmark output
+# Pattern to match a single line of Go benchmark output
 # Example: BenchmarkTUIStartup-8    1000    150000 ns/op    1024 B/op    10 allocs/op
+# Lines are matched one at a time, so the pattern is anchored at the start and
+# only uses [ \t] separators; it never has to scan across line boundaries.
 BENCHMARK_PATTERN = re.compile(
-    r"^(Benchmark\w+)(?:-\d+)?\s+"  # Benchmark name (with optional CPU count)
-    r"(\d+)\s+"                      # Iterations
-    r"([\d.]+)\s+ns/op"              # Nanoseconds per operation
-    r"(?:\s+(\d+)\s+B/op)?"          # Optional: bytes per operation
-    r"(?:\s+(\d+)\s+allocs/op)?",    # Optional: allocations per operation
-    re.MULTILINE
+    rb"^(Benchmark\S+?)(?:-\d+)?[ \t]+"   # Benchmark name (with optional CPU count)
+    rb"(\d+)[ \t]+"                       # Iterations
+    rb"([\d.]+)[ \t]+ns/op"               # Nanoseconds per operation
+    rb"(?:[ \t]+(\d+)[ \t]+B/op)?"        # Optional: bytes per operation
+    rb"(?:[ \t]+(\d+)[ \t]+allocs/op)?"   # Optional: allocations per operation
 )
 
 
-def parse_benchmark_output(content: str) -> List[BenchmarkResult]:
-    """Parse Go benchmark output into structured results."""
-    results = []
+def parse_benchmark_output(lines: Iterable[bytes]) -> Iterator[BenchmarkResult]:
+    """Parse Go benchmark output into structured results.
 
-    for match in BENCHMARK_PATTERN.finditer(content):
-        name = match.group(1)
+    Accepts any iterable of raw lines (e.g. a file opened in binary mode) so
+    input is streamed rather than buffered. Results are yielded lazily so that
+    check_gates() can parse and evaluate gates in a single pass over the input.
+    """
+    for line in lines:
+        # Cheap substring test before running the regex on every line
+        if b"Benchmark" not in line:
+            continue
+
+        match = BENCHMARK_PATTERN.match(line)
+        if not match:
+            continue
+
+        name = match.group(1).decode()
         iterations = int(match.group(2))
         ns_per_op = float(match.group(3))
         bytes_per_op = int(match.group(4)) if match.group(4) else None
         allocs_per_op = int(match.group(5)) if match.group(5) else None
 
-        results.append(BenchmarkResult(
+        yield BenchmarkResult(
             name=name,
             iterations=iterations,
             ns_per_op=ns_per_op,
             bytes_per_op=bytes_per_op,
             allocs_per_op=allocs_per_op,
-        ))
+        )
 
-    return results
 
-
-def check_gates(results: List[BenchmarkResult]) -> Dict[str, Any]:
+def check_gates(results: Iterable[BenchmarkResult]) -> Dict[str, Any]:
     """Check benchmark results against performance gates."""
     report = {
         "passed": True,
-        "total_benchmarks": len(results),
+        "total_benchmarks": 0,
         "gated_benchmarks": 0,
         "gates_passed": 0,
         "gates_failed": 0,
         "targets_met": 0,
         "results": [],
+        # Partitions of "results" for print_report(); not part of the JSON output
+        "gated_results": [],
+        "ungated_results": [],
+        "failed": [],
     }
 
     for result in results:
+        report["total_benchmarks"] += 1
         gate = PERFORMANCE_GATES.get(result.name)
 
         if gate:
@@ -148,10 +172,7 @@ def check_gates(results: List[BenchmarkResult]) -> Dict[str, Any]:
             if target_met:
                 report["targets_met"] += 1
 
-            status = "✅ PASS" if gate_passed else "❌ FAIL"
-            target_status = "🎯 TARGET" if target_met else ""
-
-            report["results"].append({
+            entry = {
                 "name": result.name,
                 "description": gate["description"],
                 "actual_ms": round(result.ms_per_op, 2),
@@ -162,10 +183,14 @@ def check_gates(results: List[BenchmarkResult]) -> Dict[str, Any]:
                 "iterations": result.iterations,
                 "bytes_per_op": result.bytes_per_op,
                 "allocs_per_op": result.allocs_per_op,
-            })
+            }
+            report["results"].append(entry)
+            report["gated_results"].append(entry)
+            if not gate_passed:
+                report["failed"].append(entry)
         else:
             # Track ungated benchmarks for informational purposes
-            report["results"].append({
+            entry = {
                 "name": result.name,
                 "description": "No gate defined",
                 "actual_ms": round(result.ms_per_op, 2),
@@ -174,15 +199,43 @@ def check_gates(results: List[BenchmarkResult]) -> Dict[str, Any]:
                 "iterations": result.iterations,
                 "bytes_per_op": result.bytes_per_op,
                 "allocs_per_op": result.allocs_per_op,
-            })
+            }
+            report["results"].append(entry)
+            report["ungated_results"].append(entry)
 
     return report
 
 
+# Report line templates, filled from the per-result dicts built by check_gates()
+GATED_RESULT_FORMAT = (
+    "\n{status}{target_status} {name}\n"
+    "   {description}\n"
+    "   Actual: {actual_ms:.2f}ms | Max: {max_ms}ms | Target: {target_ms}ms"
+)
+MEMORY_FORMAT = "   Memory: {bytes_per_op} B/op, {allocs_per_op} allocs/op"
+UNGATED_RESULT_FORMAT = "\n   {name}: {actual_ms:.2f}ms"
+FAILED_GATE_FORMAT = "  - {name}: {actual_ms:.2f}ms > {max_ms}ms"
+
+# Status labels keyed by gate_passed / target_met, used by the text report only
+GATE_STATUS = {True: "✅ PASS", False: "❌ FAIL"}
+TARGET_STATUS = {True: " 🎯", False: ""}
+
+# Report keys that only index into "results" for printing
+REPORT_PARTITIONS = ("gated_results", "ungated_results", "failed")
+
+
+def dumps_json(data: Dict[str, Any]) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 def print_report(report: Dict[str, Any], output_format: str = "text") -> None:
     """Print benchmark report in specified format."""
     if output_format == "json":
-        print(json.dumps(report, indent=2))
+        output = {key: value for key, value in report.items() if key not in REPORT_PARTITIONS}
+        print(dumps_json(output))
         return
 
     # Text format
@@ -200,24 +253,22 @@ def print_report(report: Dict[str, Any], output_format: str = "text") -> None:
     print("GATED BENCHMARKS")
     print("-" * 60)
 
-    for result in report["results"]:
-        if result.get("gate_passed") is not None:
-            status = "✅ PASS" if result["gate_passed"] else "❌ FAIL"
-            target_status = " 🎯" if result.get("target_met") else ""
-            print(f"\n{status}{target_status} {result['name']}")
-            print(f"   {result['description']}")
-            print(f"   Actual: {result['actual_ms']:.2f}ms | Max: {result['max_ms']}ms | Target: {result['target_ms']}ms")
-            if result.get("bytes_per_op"):
-                print(f"   Memory: {result['bytes_per_op']} B/op, {result.get('allocs_per_op', 0)} allocs/op")
+    for result in report["gated_results"]:
+        print(GATED_RESULT_FORMAT.format(
+            status=GATE_STATUS[result["gate_passed"]],
+            target_status=TARGET_STATUS[result["target_met"]],
+            **result,
+        ))
+        if result["bytes_per_op"]:
+            print(MEMORY_FORMAT.format_map(result))
 
     # Print ungated results
-    ungated = [r for r in report["results"] if r.get("gate_passed") is None]
-    if ungated:
+    if report["ungated_results"]:
         print("\n" + "-" * 60)
         print("OTHER BENCHMARKS (no gate)")
         print("-" * 60)
-        for result in ungated:
-            print(f"\n   {result['name']}: {result['actual_ms']:.2f}ms")
+        for result in report["ungated_results"]:
+            print(UNGATED_RESULT_FORMAT.format_map(result))
 
     # Final summary
     print("\n" + "=" * 60)
@@ -226,9 +277,8 @@ def print_report(report: Dict[str, Any], output_format: str = "text") -> None:
     else:
         print("❌ PERFORMANCE GATES FAILED")
         print("\nFailed gates:")
-        for result in report["results"]:
-            if result.get("gate_passed") is False:
-                print(f"  - {result['name']}: {result['actual_ms']:.2f}ms > {result['max_ms']}ms")
+        for result in report["failed"]:
+            print(FAILED_GATE_FORMAT.format_map(result))
     print("=" * 60 + "\n")
 
 
@@ -248,11 +298,11 @@ def main() -> int:
         elif not arg.startswith("-"):
             input_file = arg
 
-    # Read input
+    # Stream input line by line, parsing and checking in a single pass
     if input_file:
         try:
-            with open(input_file, "r") as f:
-                content = f.read()
+            with open(input_file, "rb") as f:
+                report = check_gates(parse_benchmark_output(f))
         except FileNotFoundError:
             print(f"Error: File not found: {input_file}", file=sys.stderr)
             return 1
@@ -260,22 +310,14 @@ def main() -> int:
         # Read from stdin
         if sys.stdin.isatty():
             print("Reading from stdin... (Ctrl+D to end)")
-        content = sys.stdin.read()
+        report = check_gates(parse_benchmark_output(sys.stdin.buffer))
 
-    if not content.strip():
-        print("Error: No benchmark data provided", file=sys.stderr)
-        print("Usage: go test -bench=. ./... | python3 scripts/check_benchmarks.py", file=sys.stderr)
-        return 1
-
-    # Parse and check
-    results = parse_benchmark_output(content)
-
-    if not results:
-        print("Warning: No benchmark results found in input", file=sys.stderr)
+    if not report["total_benchmarks"]:
+        print("Error: No benchmark results found in input", file=sys.stderr)
         print("Expected format: BenchmarkName-N    iterations    ns/op", file=sys.stderr)
+        print("Usage: go test -bench=. ./... | python3 scripts/check_benchmarks.py", file=sys.stderr)
         return 1
 
-    report = check_gates(results)
     print_report(report, output_format)
 
     # Exit with error if gates failed
@@ -12,16 +12,44 @@ Usage:
 """
 
 import os
+import re
 import sys
 import yaml
 import argparse
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML built without libyaml; fall back to the pure-Python loader
+    from yaml import SafeLoader
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Task statuses (lowercased) that count as complete
+_COMPLETE_STATUSES = frozenset(("done", "complete", "completed"))
+
+# Markdown status emoji keyed by lowercased task status
+STATUS_EMOJI = {
+    "done": "✅",
+    "complete": "✅",
+    "completed": "✅",
+    "in-progress": "⏳",
+}
+DEFAULT_EMOJI = "📋"
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Task:
     """Represents a sprint task."""
     id: str
@@ -29,29 +57,40 @@ class Task:
     status: str
     story_points: int = 1
     completed_date: Optional[str] = None
+    _status_norm: str = field(init=False, repr=False)
+    _is_complete: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Normalize the status once instead of on every is_complete check
+        self._status_norm = self.status.lower()
+        self._is_complete = self._status_norm in _COMPLETE_STATUSES
 
     @property
     def is_complete(self) -> bool:
-        return self.status.lower() in ("done", "complete", "completed")
+        return self._is_complete
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Sprint:
     """Represents a sprint with tasks and timeline."""
     id: str
     name: str
-    start_date: datetime
-    end_date: datetime
+    start_date: date
+    end_date: date
     goals: List[str] = field(default_factory=list)
     tasks: List[Task] = field(default_factory=list)
-
-    @property
-    def total_points(self) -> int:
-        return sum(t.story_points for t in self.tasks)
-
-    @property
-    def completed_points(self) -> int:
-        return sum(t.story_points for t in self.tasks if t.is_complete)
+    total_points: int = field(init=False)
+    completed_points: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Tally points in one pass over the tasks; charts and tables read them repeatedly
+        total = completed = 0
+        for task in self.tasks:
+            total += task.story_points
+            if task.is_complete:
+                completed += task.story_points
+        self.total_points = total
+        self.completed_points = completed
 
     @property
     def remaining_points(self) -> int:
@@ -70,12 +109,81 @@ class Sprint:
 
 def parse_sprint_yaml(filepath: str) -> Sprint:
     """Parse a sprint YAML file into a Sprint object."""
-    with open(filepath, "r") as f:
-        data = yaml.safe_load(f)
-
+    with open(filepath, "rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    return build_sprint(data, filepath)
+
+
+class _Unloaded(Enum):
+    """Marks a sprint file whose YAML has not been parsed yet.
+
+    An Enum member keeps its identity when pickled to pool workers, unlike a
+    bare object(), and cannot be confused with a file that parses to None.
+    """
+    NOT_LOADED = "not loaded"
+
+
+NOT_LOADED = _Unloaded.NOT_LOADED
+
+
+# A leading explicit document start ("---", optionally after blank or comment
+# lines); load_sprint_documents() blanks it so the joining separator does not
+# produce an extra empty document
+_LEADING_DOCUMENT_START = re.compile(rb"\A((?:[ \t]*(?:#[^\n]*)?\n)*)---[ \t]*(?:#[^\n]*)?(?=\n|\Z)")
+
+
+def load_sprint_documents(files: List[Path]) -> Optional[List[Any]]:
+    """Load several sprint files as one multi-document YAML stream.
+
+    Parsing happens once, serially, in the calling process: a single libyaml
+    pass is traded for the per-worker parsing of process_sprint_file().
+
+    Returns one parsed document per file, or None when the combined stream
+    cannot be mapped back onto the files (an unreadable file, a YAML error,
+    or a file holding no document or more than one); callers then parse the
+    files individually so each failure is reported against its own file.
+    """
+    try:
+        contents = [
+            _LEADING_DOCUMENT_START.sub(rb"\1", filepath.read_bytes(), count=1)
+            for filepath in files
+        ]
+    except OSError:
+        return None
+
+    # Line on which each file starts in the joined stream, so every document
+    # can be matched to the file it came from by position rather than count
+    file_starts = []
+    line = 0
+    for content in contents:
+        file_starts.append(line)
+        line += content.count(b"\n") + 2  # the "\n---\n" separator adds two
+
+    documents = []
+    loader = SafeLoader(b"\n---\n".join(contents))
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            index = len(documents)
+            if index >= len(files) or bisect_right(file_starts, node.start_mark.line) - 1 != index:
+                return None
+            documents.append(loader.construct_document(node))
+    except yaml.YAMLError:
+        return None
+    finally:
+        loader.dispose()
+
+    if len(documents) != len(files):
+        return None
+    return documents
+
+
+def build_sprint(data: Dict[str, Any], filepath: str) -> Sprint:
+    """Build a Sprint object from a parsed sprint YAML document."""
     # Parse dates
-    start_date = datetime.strptime(data["start_date"], "%Y-%m-%d")
-    end_date = datetime.strptime(data["end_date"], "%Y-%m-%d")
+    start_date = date.fromisoformat(data["start_date"])
+    end_date = date.fromisoformat(data["end_date"])
 
     # Parse tasks
     tasks = []
@@ -99,62 +207,140 @@ def parse_sprint_yaml(filepath: str) -> Sprint:
     )
 
 
-def calculate_ideal_burndown(sprint: Sprint) -> List[Dict[str, Any]]:
-    """Calculate ideal (linear) burndown line."""
-    points = []
-    total = sprint.total_points
-    days = sprint.duration_days
+# SVG chart layout
+SVG_WIDTH = 600
+SVG_HEIGHT = 400
+SVG_MARGIN = {"top": 40, "right": 40, "bottom": 60, "left": 60}
 
-    for day in range(days + 1):
-        date = sprint.start_date + timedelta(days=day)
-        remaining = total - (total * day / days) if days > 0 else 0
-        points.append({
-            "day": day,
-            "date": date.strftime("%Y-%m-%d"),
-            "remaining": round(remaining, 1),
-        })
+# Static SVG fragments are rendered once at import; the per-sprint pieces
+# below them are small %-templates filled in by generate_svg_chart()
+SVG_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<svg width="%(width)d" height="%(height)d" xmlns="http://www.w3.org/2000/svg">
+  <style>
+    .title { font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }
+    .axis-label { font-family: Arial, sans-serif; font-size: 12px; }
+    .legend { font-family: Arial, sans-serif; font-size: 11px; }
+    text { font-family: Arial, sans-serif; }
+  </style>
 
-    return points
+  <!-- Background -->
+  <rect width="%(width)d" height="%(height)d" fill="white"/>
 
+  <!-- Title -->
+""" % {"width": SVG_WIDTH, "height": SVG_HEIGHT}
 
-def calculate_actual_burndown(sprint: Sprint) -> List[Dict[str, Any]]:
-    """Calculate actual burndown based on task completion dates."""
-    points = []
-    remaining = sprint.total_points
+SVG_TITLE = """  <text x="%d" y="25" text-anchor="middle" class="title">%%s - Burndown Chart</text>
 
-    # Group completed tasks by date
-    completions_by_date: Dict[str, int] = {}
-    for task in sprint.tasks:
-        if task.is_complete and task.completed_date:
-            date = task.completed_date
-            completions_by_date[date] = completions_by_date.get(date, 0) + task.story_points
+  <!-- Grid -->
+""" % (SVG_WIDTH // 2)
 
-    # Build actual burndown
-    for day in range(sprint.duration_days + 1):
-        date = sprint.start_date + timedelta(days=day)
-        date_str = date.strftime("%Y-%m-%d")
+SVG_GRID_LINE = '  <line x1="%d" y1="%%.1f" x2="%d" y2="%%.1f" stroke="#e0e0e0" stroke-width="1"/>\n' % (
+    SVG_MARGIN["left"], SVG_WIDTH - SVG_MARGIN["right"]
+)
 
-        # Subtract completed points for this date
-        if date_str in completions_by_date:
-            remaining -= completions_by_date[date_str]
+SVG_AXES = """
+  <!-- Axes -->
+  <line x1="%(left)d" y1="%(top)d" x2="%(left)d" y2="%(bottom)d" stroke="black" stroke-width="2"/>
+  <line x1="%(left)d" y1="%(bottom)d" x2="%(right)d" y2="%(bottom)d" stroke="black" stroke-width="2"/>
+
+  <!-- Axis Labels -->
+  <text x="%(center_x)d" y="%(days_y)d" text-anchor="middle" class="axis-label">Days</text>
+  <text x="15" y="%(center_y)d" text-anchor="middle" transform="rotate(-90, 15, %(center_y)d)" class="axis-label">Story Points Remaining</text>
+
+  <!-- X-axis tick labels -->
+""" % {
+    "left": SVG_MARGIN["left"],
+    "top": SVG_MARGIN["top"],
+    "right": SVG_WIDTH - SVG_MARGIN["right"],
+    "bottom": SVG_HEIGHT - SVG_MARGIN["bottom"],
+    "center_x": SVG_WIDTH // 2,
+    "center_y": SVG_HEIGHT // 2,
+    "days_y": SVG_HEIGHT - 10,
+}
+
+SVG_X_LABEL = '  <text x="%%.1f" y="%d" text-anchor="middle" font-size="10">%%s</text>\n' % (
+    SVG_HEIGHT - SVG_MARGIN["bottom"] + 20
+)
+
+SVG_Y_LABELS_COMMENT = """
+  <!-- Y-axis tick labels -->
+"""
+
+SVG_Y_LABEL = '  <text x="%d" y="%%.1f" text-anchor="end" font-size="10">%%d</text>\n' % (
+    SVG_MARGIN["left"] - 10
+)
+
+SVG_IDEAL_PATH = """
+  <!-- Ideal Burndown Line -->
+  <path d="%s" fill="none" stroke="#2196F3" stroke-width="2" stroke-dasharray="5,5"/>
+
+  <!-- Actual Burndown Line -->
+"""
+
+SVG_ACTUAL_PATH = """  <path d="%s" fill="none" stroke="#4CAF50" stroke-width="3"/>
+"""
+
+SVG_FOOTER = """
+  <!-- Legend -->
+  <line x1="%(legend_x)d" y1="55" x2="%(legend_end)d" y2="55" stroke="#2196F3" stroke-width="2" stroke-dasharray="5,5"/>
+  <text x="%(legend_text)d" y="58" class="legend">Ideal</text>
+
+  <line x1="%(legend_x)d" y1="75" x2="%(legend_end)d" y2="75" stroke="#4CAF50" stroke-width="3"/>
+  <text x="%(legend_text)d" y="78" class="legend">Actual</text>
+
+  <!-- Progress indicator -->
+  <text x="%(legend_x)d" y="100" class="legend">Progress: %%.0f%%%%</text>
+  <text x="%(legend_x)d" y="115" class="legend">%%d/%%d points</text>
+</svg>""" % {
+    "legend_x": SVG_WIDTH - 150,
+    "legend_end": SVG_WIDTH - 120,
+    "legend_text": SVG_WIDTH - 115,
+}
+
+
+# Shared date axis plus ideal and actual remaining points, indexed by sprint day
+Burndown = Tuple[List[str], List[float], List[int]]
+
+
+def compute_burndown(sprint: Sprint) -> Burndown:
+    """Calculate the ideal (linear) and actual burndown lines over one date axis."""
+    total = sprint.total_points
+    days = sprint.duration_days
+    start_date = sprint.start_date
+
+    dates = [
+        (start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+        for day in range(days + 1)
+    ]
+
+    if days > 0:
+        ideal = [round(total - (total * day / days), 1) for day in range(days + 1)]
+    else:
+        ideal = [0] * len(dates)
+
+    # Scatter completed points onto the day they were completed; completions
+    # outside the sprint window are ignored
+    day_by_date = {date_str: day for day, date_str in enumerate(dates)}
+    completions = [0] * len(dates)
+    for task in sprint.tasks:
+        if task.is_complete and task.completed_date:
+            day = day_by_date.get(task.completed_date)
+            if day is not None:
+                completions[day] += task.story_points
 
-        points.append({
-            "day": day,
-            "date": date_str,
-            "remaining": max(0, remaining),
-        })
+    actual = [max(0, total - completed) for completed in accumulate(completions)]
 
-    return points
+    return dates, ideal, actual
 
 
-def generate_svg_chart(sprint: Sprint, ideal: List[Dict], actual: List[Dict]) -> str:
+def generate_svg_chart(sprint: Sprint, burndown: Burndown) -> str:
     """Generate SVG burndown chart."""
+    dates, ideal, actual = burndown
+
     # Chart dimensions
-    width = 600
-    height = 400
-    margin = {"top": 40, "right": 40, "bottom": 60, "left": 60}
-    chart_width = width - margin["left"] - margin["right"]
-    chart_height = height - margin["top"] - margin["bottom"]
+    margin = SVG_MARGIN
+    chart_width = SVG_WIDTH - margin["left"] - margin["right"]
+    chart_height = SVG_HEIGHT - margin["top"] - margin["bottom"]
 
     # Scale factors
     max_points = sprint.total_points
@@ -162,144 +348,156 @@ def generate_svg_chart(sprint: Sprint, ideal: List[Dict], actual: List[Dict]) ->
     x_scale = chart_width / max_days if max_days > 0 else 0
     y_scale = chart_height / max_points if max_points > 0 else 0
 
-    # Generate ideal line path
-    ideal_path = "M " + " L ".join(
-        f"{margin['left'] + p['day'] * x_scale},{margin['top'] + (max_points - p['remaining']) * y_scale}"
-        for p in ideal
-    )
+    # Pixel coordinates for every day; shared by both lines and the x-axis labels
+    xs = [margin["left"] + day * x_scale for day in range(len(dates))]
 
-    # Generate actual line path (only up to current data)
-    today = datetime.now().strftime("%Y-%m-%d")
-    actual_filtered = [p for p in actual if p["date"] <= today]
-    actual_path = ""
-    if actual_filtered:
-        actual_path = "M " + " L ".join(
-            f"{margin['left'] + p['day'] * x_scale},{margin['top'] + (max_points - p['remaining']) * y_scale}"
-            for p in actual_filtered
-        )
+    parts = [SVG_HEADER, SVG_TITLE % sprint.name]
 
-    # Generate x-axis labels (every other day for readability)
-    x_labels = ""
-    for i, p in enumerate(ideal):
-        if i % 2 == 0 or i == len(ideal) - 1:
-            x = margin["left"] + p["day"] * x_scale
-            y = height - margin["bottom"] + 20
-            date_short = datetime.strptime(p["date"], "%Y-%m-%d").strftime("%m/%d")
-            x_labels += f'<text x="{x}" y="{y}" text-anchor="middle" font-size="10">{date_short}</text>\n'
-
-    # Generate y-axis labels
-    y_labels = ""
+    # Grid lines
     step = max(1, max_points // 5)
-    for points in range(0, max_points + 1, step):
-        x = margin["left"] - 10
-        y = margin["top"] + (max_points - points) * y_scale + 4
-        y_labels += f'<text x="{x}" y="{y}" text-anchor="end" font-size="10">{points}</text>\n'
-
-    # Generate grid lines
-    grid_lines = ""
     for points in range(0, max_points + 1, step):
         y = margin["top"] + (max_points - points) * y_scale
-        grid_lines += f'<line x1="{margin["left"]}" y1="{y}" x2="{width - margin["right"]}" y2="{y}" stroke="#e0e0e0" stroke-width="1"/>\n'
-
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
-  <style>
-    .title {{ font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }}
-    .axis-label {{ font-family: Arial, sans-serif; font-size: 12px; }}
-    .legend {{ font-family: Arial, sans-serif; font-size: 11px; }}
-    text {{ font-family: Arial, sans-serif; }}
-  </style>
-
-  <!-- Background -->
-  <rect width="{width}" height="{height}" fill="white"/>
-
-  <!-- Title -->
-  <text x="{width/2}" y="25" text-anchor="middle" class="title">{sprint.name} - Burndown Chart</text>
+        parts.append(SVG_GRID_LINE % (y, y))
 
-  <!-- Grid -->
-  {grid_lines}
+    parts.append(SVG_AXES)
 
-  <!-- Axes -->
-  <line x1="{margin['left']}" y1="{margin['top']}" x2="{margin['left']}" y2="{height - margin['bottom']}" stroke="black" stroke-width="2"/>
-  <line x1="{margin['left']}" y1="{height - margin['bottom']}" x2="{width - margin['right']}" y2="{height - margin['bottom']}" stroke="black" stroke-width="2"/>
+    # X-axis labels (every other day for readability)
+    for day in range(len(dates)):
+        if day % 2 == 0 or day == len(dates) - 1:
+            date_short = (sprint.start_date + timedelta(days=day)).strftime("%m/%d")
+            parts.append(SVG_X_LABEL % (xs[day], date_short))
 
-  <!-- Axis Labels -->
-  <text x="{width/2}" y="{height - 10}" text-anchor="middle" class="axis-label">Days</text>
-  <text x="15" y="{height/2}" text-anchor="middle" transform="rotate(-90, 15, {height/2})" class="axis-label">Story Points Remaining</text>
+    parts.append(SVG_Y_LABELS_COMMENT)
 
-  <!-- X-axis tick labels -->
-  {x_labels}
-
-  <!-- Y-axis tick labels -->
-  {y_labels}
-
-  <!-- Ideal Burndown Line -->
-  <path d="{ideal_path}" fill="none" stroke="#2196F3" stroke-width="2" stroke-dasharray="5,5"/>
+    # Y-axis labels
+    for points in range(0, max_points + 1, step):
+        y = margin["top"] + (max_points - points) * y_scale + 4
+        parts.append(SVG_Y_LABEL % (y, points))
 
-  <!-- Actual Burndown Line -->
-  {f'<path d="{actual_path}" fill="none" stroke="#4CAF50" stroke-width="3"/>' if actual_path else ''}
+    # Ideal line path
+    ideal_ys = [margin["top"] + (max_points - remaining) * y_scale for remaining in ideal]
+    ideal_path = "M " + " L ".join(["%.1f,%.1f" % point for point in zip(xs, ideal_ys)])
+    parts.append(SVG_IDEAL_PATH % ideal_path)
 
-  <!-- Legend -->
-  <line x1="{width - 150}" y1="55" x2="{width - 120}" y2="55" stroke="#2196F3" stroke-width="2" stroke-dasharray="5,5"/>
-  <text x="{width - 115}" y="58" class="legend">Ideal</text>
+    # Actual line path (only up to current data)
+    today = date.today().isoformat()
+    actual_filtered = actual[:bisect_right(dates, today)]
+    if actual_filtered:
+        actual_ys = [margin["top"] + (max_points - remaining) * y_scale for remaining in actual_filtered]
+        actual_path = "M " + " L ".join(["%.1f,%.1f" % point for point in zip(xs, actual_ys)])
+        parts.append(SVG_ACTUAL_PATH % actual_path)
 
-  <line x1="{width - 150}" y1="75" x2="{width - 120}" y2="75" stroke="#4CAF50" stroke-width="3"/>
-  <text x="{width - 115}" y="78" class="legend">Actual</text>
+    parts.append(SVG_FOOTER % (sprint.progress_percent, sprint.completed_points, sprint.total_points))
 
-  <!-- Progress indicator -->
-  <text x="{width - 150}" y="100" class="legend">Progress: {sprint.progress_percent:.0f}%</text>
-  <text x="{width - 150}" y="115" class="legend">{sprint.completed_points}/{sprint.total_points} points</text>
-</svg>'''
+    svg = "".join(parts)
 
     return svg
 
 
-def generate_markdown_table(sprint: Sprint) -> str:
+# Static Markdown section headers
+MARKDOWN_GOALS_HEADER = ("", "### Goals", "")
+MARKDOWN_TASKS_HEADER = (
+    "",
+    "### Tasks",
+    "",
+    "| ID | Task | Status | Points |",
+    "|:---|:-----|:-------|-------:|",
+)
+MARKDOWN_BURNDOWN_HEADER = (
+    "",
+    "### Burndown Data",
+    "",
+    "| Day | Date | Ideal | Actual |",
+    "|----:|:-----|------:|-------:|",
+)
+
+
+def generate_markdown_table(sprint: Sprint, burndown: Burndown) -> str:
     """Generate Markdown table with sprint status."""
     lines = [
         f"## {sprint.name} Status",
         "",
         f"**Sprint Period**: {sprint.start_date.strftime('%Y-%m-%d')} to {sprint.end_date.strftime('%Y-%m-%d')}",
         f"**Progress**: {sprint.completed_points}/{sprint.total_points} points ({sprint.progress_percent:.0f}%)",
-        "",
-        "### Goals",
-        "",
     ]
 
-    for goal in sprint.goals:
-        lines.append(f"- {goal}")
-
-    lines.extend([
-        "",
-        "### Tasks",
-        "",
-        "| ID | Task | Status | Points |",
-        "|:---|:-----|:-------|-------:|",
-    ])
+    lines += MARKDOWN_GOALS_HEADER
+    lines += [f"- {goal}" for goal in sprint.goals]
 
-    for task in sprint.tasks:
-        status_emoji = "✅" if task.is_complete else "⏳" if task.status == "in-progress" else "📋"
-        lines.append(f"| {task.id} | {task.title} | {status_emoji} {task.status} | {task.story_points} |")
+    lines += MARKDOWN_TASKS_HEADER
+    lines += [
+        f"| {task.id} | {task.title} | {STATUS_EMOJI.get(task._status_norm, DEFAULT_EMOJI)} {task.status} | {task.story_points} |"
+        for task in sprint.tasks
+    ]
 
-    lines.extend([
-        "",
-        "### Burndown Data",
-        "",
-        "| Day | Date | Ideal | Actual |",
-        "|----:|:-----|------:|-------:|",
-    ])
+    lines += MARKDOWN_BURNDOWN_HEADER
 
-    ideal = calculate_ideal_burndown(sprint)
-    actual = calculate_actual_burndown(sprint)
-    today = datetime.now().strftime("%Y-%m-%d")
+    dates, ideal, actual = burndown
+    today = date.today().isoformat()
+    days_elapsed = bisect_right(dates, today)
 
-    for i, p in enumerate(ideal):
-        actual_val = actual[i]["remaining"] if i < len(actual) and actual[i]["date"] <= today else "-"
-        lines.append(f"| {p['day']} | {p['date']} | {p['remaining']:.1f} | {actual_val} |")
+    lines += [
+        f"| {day} | {date_str} | {remaining:.1f} | {actual[day] if day < days_elapsed else '-'} |"
+        for day, (date_str, remaining) in enumerate(zip(dates, ideal))
+    ]
 
     return "\n".join(lines)
 
 
+def process_sprint_file(
+    filepath: Path,
+    output_dir: Optional[Path],
+    output_format: str,
+    data: Any = NOT_LOADED,
+) -> List[str]:
+    """Generate outputs for one sprint file.
+
+    data is the already-parsed YAML document, or NOT_LOADED to read the
+    file here. Returns the messages to print: the generated documents
+    themselves when output_dir is None (--stdout), otherwise one line per
+    file written.
+    """
+    if data is NOT_LOADED:
+        sprint = parse_sprint_yaml(str(filepath))
+    else:
+        sprint = build_sprint(data, str(filepath))
+    burndown = compute_burndown(sprint)
+    outputs = []
+
+    if output_dir is None:
+        if output_format in ("svg", "both"):
+            outputs.append(generate_svg_chart(sprint, burndown))
+        if output_format in ("md", "both"):
+            outputs.append(generate_markdown_table(sprint, burndown))
+        return outputs
+
+    base_name = filepath.stem
+
+    if output_format in ("svg", "both"):
+        svg_path = output_dir / f"{base_name}-burndown.svg"
+        svg_path.write_text(generate_svg_chart(sprint, burndown))
+        outputs.append(f"Generated: {svg_path}")
+
+    if output_format in ("md", "both"):
+        md_path = output_dir / f"{base_name}-status.md"
+        md_path.write_text(generate_markdown_table(sprint, burndown))
+        outputs.append(f"Generated: {md_path}")
+
+    return outputs
+
+
+def print_outputs(filepath: Path, produce: Callable[[], List[str]]) -> None:
+    """Print the outputs for one sprint file, reporting errors without aborting."""
+    try:
+        outputs = produce()
+    except Exception as e:
+        print(f"Error processing {filepath}: {e}", file=sys.stderr)
+        return
+
+    for output in outputs:
+        print(output)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -353,42 +551,36 @@ def main():
         return 1
 
     # Create output directory
+    output_dir = None
     if not args.stdout:
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process each file
+    existing = []
     for filepath in files:
         if not filepath.exists():
             print(f"Warning: File not found: {filepath}", file=sys.stderr)
             continue
-
-        try:
-            sprint = parse_sprint_yaml(str(filepath))
-            ideal = calculate_ideal_burndown(sprint)
-            actual = calculate_actual_burndown(sprint)
-
-            if args.stdout:
-                if args.format in ("svg", "both"):
-                    print(generate_svg_chart(sprint, ideal, actual))
-                if args.format in ("md", "both"):
-                    print(generate_markdown_table(sprint))
-            else:
-                base_name = filepath.stem
-
-                if args.format in ("svg", "both"):
-                    svg_path = output_dir / f"{base_name}-burndown.svg"
-                    svg_path.write_text(generate_svg_chart(sprint, ideal, actual))
-                    print(f"Generated: {svg_path}")
-
-                if args.format in ("md", "both"):
-                    md_path = output_dir / f"{base_name}-status.md"
-                    md_path.write_text(generate_markdown_table(sprint))
-                    print(f"Generated: {md_path}")
-
-        except Exception as e:
-            print(f"Error processing {filepath}: {e}", file=sys.stderr)
-            continue
+        existing.append(filepath)
+
+    # With --all, parse every sprint file in one YAML stream up front
+    documents = load_sprint_documents(existing) if args.all and len(existing) > 1 else None
+    if documents is None:
+        documents = [NOT_LOADED] * len(existing)
+
+    # Sprint files are independent, so write them from a process pool when
+    # there are several; --stdout stays serial to keep the output ordered
+    if len(existing) > 1 and not args.stdout:
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(process_sprint_file, filepath, output_dir, args.format, data)
+                for filepath, data in zip(existing, documents)
+            ]
+            for filepath, future in zip(existing, futures):
+                print_outputs(filepath, future.result)
+    else:
+        for filepath, data in zip(existing, documents):
+            print_outputs(filepath, partial(process_sprint_file, filepath, output_dir, args.format, data))
 
     return 0
 